@@ -10,7 +10,7 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
-import configparser
+import functools
 
 # 🧠 First-party (project-specific)
 import models.user_model
@@ -18,9 +18,19 @@ import models.user_model
 from utils.logger import get_logger
 from utils.messenger import Messenger
 from utils.resources import get_config_path
+from utils.config_cache import load_config
 from utils.login_services import LoginServices
 
 
+@functools.cache
+def _get_work_order_controller_cls():
+    """
+    Returns WorkOrderController class, importing it only on the first call (avoids circular import).
+    """
+    from controllers.work_order_controller import WorkOrderController
+    return WorkOrderController
+
+
 class LoginController:
     """
     Handles login validation and transitions to the work order phase.
@@ -32,9 +42,7 @@ class LoginController:
         """
         # 📌 Loading the configuration file
         config_path = get_config_path("config.ini")
-        self.config = configparser.ConfigParser()
-        self.config.optionxform = str  # 💡 Ensures letter size is maintained
-        self.config.read(config_path)
+        self.config = load_config(config_path)
 
         # 📌 Initialization
         self.login_window = login_window
@@ -67,7 +75,7 @@ class LoginController:
                 self.login_window.password_input.clear()
                 self.login_window.password_input.setFocus()
         except Exception as e:
-            self.logger.error("Neočekávaný problém: %s", str(e))
+            self.logger.error("Neočekávaný problém: %s", e)
             self.messenger.error(str(e), "Login Ctrl")
             self.login_window.password_input.clear()
             self.login_window.password_input.setFocus()
@@ -76,8 +84,8 @@ class LoginController:
         """
         Instantiates and opens the WorkOrderController window.
         """
-        from controllers.work_order_controller import WorkOrderController
-        self.work_order_controller = WorkOrderController(self.window_stack)
+        work_order_controller_cls = _get_work_order_controller_cls()
+        self.work_order_controller = work_order_controller_cls(self.window_stack)
         self.window_stack.push(self.work_order_controller.work_order_window)
 
     def handle_exit(self):
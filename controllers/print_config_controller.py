@@ -25,6 +25,20 @@ class PrintConfigController:
         self.messenger = messenger
         self.logger = get_logger("PrintConfigController")
 
+        # 📌 Parsed ProductTriggerMapping (group → set of products), built on first lookup
+        self._trigger_mapping: dict[str, frozenset[str]] | None = None
+
+    def _get_trigger_mapping(self) -> dict[str, frozenset[str]]:
+        """
+        Returns ProductTriggerMapping parsed into sets, splitting the comma lists only once.
+        """
+        if self._trigger_mapping is None:
+            self._trigger_mapping = {
+                group_name: frozenset(item.strip() for item in raw_list.split(",") if item.strip())
+                for group_name, raw_list in self.config.items("ProductTriggerMapping")
+            }
+        return self._trigger_mapping
+
     def get_trigger_groups_for_product(self, product_name: str) -> list[str] | None:
         """
         Returns trigger groups that include the given product name.
@@ -36,13 +50,7 @@ class PrintConfigController:
             self.messenger.warning("Sekce 'ProductTriggerMapping' nebyla nalezena v configu.", "Print Config Ctrl")
             return None
 
-        matching = []
-
-        for group_name in self.config.options("ProductTriggerMapping"):
-            raw_list = self.config.get("ProductTriggerMapping", group_name)
-            items = [item.strip() for item in raw_list.split(",") if item.strip()]
-            if product_name in items:
-                matching.append(group_name)
+        matching = [group_name for group_name, products in self._get_trigger_mapping().items() if product_name in products]
 
         if not matching:
             self.logger.error("Produkt '%s' není mapován na žádnou skupinu v configu.", product_name)
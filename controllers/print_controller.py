@@ -11,7 +11,8 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
-import configparser
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
 
 # 🧩 Third-party libraries
@@ -21,6 +22,7 @@ from PyQt6.QtCore import QTimer, QCoreApplication
 from utils.logger import get_logger
 from utils.messenger import Messenger
 from utils.resources import get_config_path
+from utils.config_cache import load_config
 from utils.validators import Validator
 from utils.app_services import AppServices
 
@@ -41,9 +43,7 @@ class PrintController:
         """
         # 📌 Loading the configuration file
         config_path = get_config_path("config.ini")
-        self.config = configparser.ConfigParser()
-        self.config.optionxform = str  # 💡 Ensures letter size is maintained
-        self.config.read(config_path)
+        self.config = load_config(config_path)
 
         # 📌 Initialization
         self.window_stack = window_stack
@@ -53,6 +53,8 @@ class PrintController:
         self.loader = PrintLoaderController(self.messenger)
         self.logger = get_logger("PrintController")
         self.services = AppServices(config=self.config, messenger=self.messenger)
+        self.executor = ThreadPoolExecutor(max_workers=3)
+        self._info_dialog = None
 
         # 📌 Initialization of print logic
         self.logic = PrintLogicController(
@@ -61,6 +63,11 @@ class PrintController:
             print_window=self.print_window
         )
 
+        # 📌 Polls whether BarTender has consumed the trigger files
+        self._trigger_poll = QTimer(self.print_window)
+        self._trigger_poll.setInterval(100)
+        self._trigger_poll.timeout.connect(self._check_triggers_consumed)
+
         # 🔗 linking the button to the method
         self.print_window.print_button.clicked.connect(self.print_button_click)
         self.print_window.back_button.clicked.connect(self.handle_back)
@@ -80,66 +87,66 @@ class PrintController:
         """
         return self.print_window.product_name.strip().upper()
 
-    def handle_product_print(self, lbl_lines: list[str]):
+    def handle_product_print(self, lbl_lines: list[str], serial: str):
         """
-        Executes product-type save-and-print workflow.
+        Prepares product-type save-and-print workflow.
 
         Validates input lines, extracts header and record, injects prefix,
-        retrieves trigger values, and performs the print operation.
+        retrieves trigger values, and returns the print job (or None on failure).
         """
-        if not self.validator.validate_input_exists_for_product(lbl_lines, self.serial_input):
+        if not self.validator.validate_input_exists_for_product(lbl_lines, serial):
             self.delayed_restore_ui()
-            return
+            return None
 
-        result = self.validator.extract_header_and_record(lbl_lines, self.serial_input)
+        result = self.validator.extract_header_and_record(lbl_lines, serial)
         if not result:
             self.delayed_restore_ui()
-            return
+            return None
         header, record = result
 
         new_record = self.validator.validate_and_inject_balice(header, record)
         if new_record is None:
             self.delayed_restore_ui()
-            return
+            return None
 
-        trigger_values = self.validator.extract_trigger_values(lbl_lines, self.serial_input)
+        trigger_values = self.validator.extract_trigger_values(lbl_lines, serial)
         if not trigger_values:
             self.delayed_restore_ui()
-            return
+            return None
 
-        self.logic.product_save_and_print(header, new_record, trigger_values)
-        self.logger.info("%s %s", self.product_name, self.serial_input)
+        self.logger.info("%s %s", self.product_name, serial)
+        return partial(self.logic.product_save_and_print, header, new_record, trigger_values)
 
-    def handle_control4_print(self, lbl_lines: list[str]):
+    def handle_control4_print(self, lbl_lines: list[str], serial: str):
         """
-        Executes Control4 save-and-print workflow.
+        Prepares Control4 save-and-print workflow.
 
         Validates input lines, extracts header and record, retrieves trigger values,
-        and performs the print operation.
+        and returns the print job (or None on failure).
         """
-        if not self.validator.validate_input_exists_for_control4(lbl_lines, self.serial_input):
+        if not self.validator.validate_input_exists_for_control4(lbl_lines, serial):
             self.delayed_restore_ui()
-            return
+            return None
 
-        result = self.validator.extract_header_and_record_c4(lbl_lines, self.serial_input)
+        result = self.validator.extract_header_and_record_c4(lbl_lines, serial)
         if not result:
             self.delayed_restore_ui()
-            return
+            return None
         header, record = result
 
-        trigger_values = self.validator.extract_trigger_values_c4(lbl_lines, self.serial_input)
+        trigger_values = self.validator.extract_trigger_values_c4(lbl_lines, serial)
         if not trigger_values:
             self.delayed_restore_ui()
-            return
+            return None
 
-        self.logic.control4_save_and_print(header, record, trigger_values)
-        self.logger.info("Control4 %s", self.serial_input)
+        self.logger.info("Control4 %s", serial)
+        return partial(self.logic.control4_save_and_print, header, record, trigger_values)
 
-    def handle_my2n_print(self):
+    def handle_my2n_print(self, serial: str):
         """
-        Executes My2N save-and-print workflow.
+        Prepares My2N save-and-print workflow.
 
-        Validates config paths, extracts token, and performs the print operation.
+        Validates config paths, extracts token, and returns the print job (or None on failure).
         """
         reports_path = Path(self.config.get("Paths", "reports_path"))
         output_path = Path(self.config.get("My2nPaths", "output_file_path_my2n"))
@@ -148,24 +155,25 @@ class PrintController:
             self.logger.error("Cesty k reportu nebo výstupu nejsou definovány.")
             self.messenger.error("Chybí konfigurace cest pro My2N.", "Print Ctrl")
             self.delayed_restore_ui()
-            return
+            return None
 
-        token = self.validator.extract_my2n_token(self.serial_input, reports_path)
+        token = self.validator.extract_my2n_token(serial, reports_path)
         if not token:
             self.delayed_restore_ui()
-            return
+            return None
 
-        self.logic.my2n_save_and_print(self.serial_input, token)
         self.logger.info("My2N token: %s", token)
+        return partial(self.logic.my2n_save_and_print, serial, token)
 
     def print_button_click(self):
         """
         Main print workflow triggered by user.
         """
         self.print_window.disable_inputs()
+        serial = self.serial_input
 
         # === 1️⃣ Validate serial number input
-        if not self.validator.validate_serial_format(self.serial_input):
+        if not self.validator.validate_serial_format(serial):
             self.delayed_restore_ui()
             return
 
@@ -176,28 +184,64 @@ class PrintController:
             self.delayed_restore_ui()
             return
 
-        # === 3️⃣ Load corresponding .lbl file lines
-        lbl_lines = self.loader.load_lbl_file(order_code=self.print_window.order_code)
-        if not lbl_lines:
-            self.logger.error("Soubor .lbl nelze načíst nebo je prázdný!")
-            self.messenger.error("Soubor .lbl nelze načíst nebo je prázdný!", "Print Ctrl")
-            self.delayed_restore_ui()
-            return
+        # === 3️⃣ Load corresponding .lbl file lines (My2N alone does not need them)
+        lbl_lines = []
+        if "product" in triggers or "control4" in triggers:
+            lbl_lines = self.loader.load_lbl_file(order_code=self.print_window.order_code)
+            if not lbl_lines:
+                self.logger.error("Soubor .lbl nelze načíst nebo je prázdný!")
+                self.messenger.error("Soubor .lbl nelze načíst nebo je prázdný!", "Print Ctrl")
+                self.delayed_restore_ui()
+                return
 
-        # 📌 Execute save-and-print functions as needed
-        if "product" in triggers and lbl_lines:
-            self.handle_product_print(lbl_lines)
+        jobs = []
 
-        # 📌 Execute control4-save-and-print functions as needed
-        if "control4" in triggers and lbl_lines:
-            self.handle_control4_print(lbl_lines)
+        # 📌 Prepare save-and-print functions as needed
+        if "product" in triggers:
+            jobs.append(self.handle_product_print(lbl_lines, serial))
 
-        # 📌 Execute my2n-save-and-print functions as needed
+        # 📌 Prepare control4-save-and-print functions as needed
+        if "control4" in triggers:
+            jobs.append(self.handle_control4_print(lbl_lines, serial))
+
+        # 📌 Prepare my2n-save-and-print functions as needed
         if "my2n" in triggers:
-            self.handle_my2n_print()
+            jobs.append(self.handle_my2n_print(serial))
+
+        # === 4️⃣ Write outputs and triggers in parallel, then report any failures
+        self.logic.reset_active_triggers()
+        done, _ = wait([self.executor.submit(job) for job in jobs if job])
+        self.logic.flush_notifications()
+
+        # ❌ wait() does not re-raise, report anything a job raised past its own handler
+        for future in done:
+            error = future.exception()
+            if error is not None:
+                self.logger.error("Neočekávaná chyba při tisku: %s", error)
+                self.messenger.error(f"Neočekávaná chyba při tisku: {error}", "Print Ctrl")
+
+        # === 5️⃣ Keep the UI locked until BarTender consumes the triggers (at most 3 s)
+        self._info_dialog = self.messenger.auto_info_dialog(
+            "Zpracovávám požadavek...", timeout_ms=3000, finished_callback=self._finish_print
+        )
+        self._trigger_poll.start()
 
-        self.messenger.auto_info_dialog("Zpracovávám požadavek...", timeout_ms=3000)
-        self.restore_ui()
+    def _check_triggers_consumed(self):
+        """
+        Finishes the print early once all trigger files have been consumed.
+        """
+        if not self.logic.triggers_pending():
+            self._finish_print()
+
+    def _finish_print(self):
+        """
+        Stops trigger polling, closes the info dialog, and restores the UI.
+        """
+        self._trigger_poll.stop()
+        if self._info_dialog is not None:
+            self._info_dialog.close()
+            self._info_dialog = None
+        self.print_window.restore_inputs()
 
     def handle_back(self):
         """
@@ -205,6 +249,7 @@ class PrintController:
         """
         bartender = self.services.bartender_cls(messenger=self.messenger, config=self.config)
         bartender.kill_processes()
+        self.executor.shutdown(wait=False)
         self.print_window.effects.fade_out(self.print_window)
 
     def handle_exit(self):
@@ -214,6 +259,7 @@ class PrintController:
         self.logger.info("Aplikace byla ukončena uživatelem.")
         bartender = self.services.bartender_cls(messenger=self.messenger, config=self.config)
         bartender.kill_processes()
+        self.executor.shutdown(wait=False)
         self.window_stack.mark_exiting()
         self.print_window.effects.fade_out(self.print_window, callback=QCoreApplication.instance().quit)
 
@@ -222,9 +268,3 @@ class PrintController:
         Restores UI controls after a short delay (default 500 ms).
         """
         QTimer.singleShot(delay_ms,  self.print_window.restore_inputs)
-
-    def restore_ui(self, delay_ms=3000):
-        """
-        Restores UI controls after a longer delay (default 3000 ms).
-        """
-        QTimer.singleShot(delay_ms,  self.print_window.restore_inputs)
@@ -10,13 +10,15 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
-import configparser
+import os
 from pathlib import Path
 
 # 🧠 First-party (project-specific)
 from utils.logger import get_logger
 from utils.messenger import Messenger
 from utils.resources import get_config_path
+from utils.config_cache import load_config
+from utils.order_data import ORDER_FILE_ENCODING
 
 
 class PrintLoaderController:
@@ -30,9 +32,12 @@ class PrintLoaderController:
         Initializes loader with config and messenger for error reporting.
         """
         config_path = get_config_path("config.ini")
-        self.config = configparser.ConfigParser()
-        self.config.optionxform = str
-        self.config.read(config_path)
+        self.config = load_config(config_path)
+
+        # 📌 Orders directory does not change at runtime, resolve it once
+        raw_orders_path = self.config.get("Paths", "orders_path", fallback="")
+        self._orders_dir = Path(raw_orders_path) if raw_orders_path else None
+        self._orders_prefix = str(self._orders_dir) + os.sep if self._orders_dir else ""
 
         self.messenger = messenger
         self.logger = get_logger("PrintLoaderController")
@@ -44,28 +49,28 @@ class PrintLoaderController:
         Handles missing paths, file absence, and read errors.
         Returns list of lines or empty list on failure.
         """
-        raw_orders_path = self.config.get("Paths", "orders_path", fallback="")
-
-        if not raw_orders_path:
-            self.logger.error("Konfigurační cesta %s nebyla nalezena!", raw_orders_path)
-            self.messenger.error(f"Konfigurační cesta {raw_orders_path} nebyla nalezena!", "Print Loader Ctrl")
+        if self._orders_dir is None:
+            self.logger.error("Konfigurační cesta %s nebyla nalezena!", "orders_path")
+            self.messenger.error("Konfigurační cesta orders_path nebyla nalezena!", "Print Loader Ctrl")
             if reset_focus_callback:
                 reset_focus_callback()
             return []
 
-        lbl_file = Path(raw_orders_path) / f"{order_code}.lbl"
+        lbl_file = self._orders_prefix + order_code + ".lbl"
 
-        if not lbl_file.exists():
+        try:
+            # 📌 Unbuffered read slurps the whole (small) file in one read() call, no exists() probe first
+            with open(lbl_file, "rb", buffering=0) as file:
+                data = file.read()
+            return data.decode(ORDER_FILE_ENCODING).splitlines()
+        except FileNotFoundError:
             self.logger.warning("Soubor %s neexistuje.", lbl_file)
             self.messenger.warning(f"Soubor {lbl_file} neexistuje.", "Print Loader Ctrl")
             if reset_focus_callback:
                 reset_focus_callback()
             return []
-
-        try:
-            return lbl_file.read_text().splitlines()
         except Exception as e:
-            self.logger.error("Chyba načtení souboru: %s", str(e))
+            self.logger.error("Chyba načtení souboru: %s", e)
             self.messenger.error(f"Chyba načtení souboru: {str(e)}", "Print Loader Ctrl")
             if reset_focus_callback:
                 reset_focus_callback()
@@ -10,11 +10,25 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
+import locale
+import os
+import threading
 from pathlib import Path
 
 # 🧠 First-party (project-specific)
 from utils.logger import get_logger
 
+# 📌 Trigger files only need to exist, no mtime bump (utime) is required
+_TRIGGER_FLAGS = os.O_WRONLY | os.O_CREAT
+
+# 📌 Output files keep the platform's default text encoding and line ending (as open("w") did)
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+_NEWLINE = os.linesep
+_OUTPUT_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# 📌 Fixed My2N column header, built once
+_MY2N_HEADER = '"L Vyrobni cislo dlouhe","L Bezpecnostni cislo","P Vyrobni cislo","P Bezpecnostni kod"' + _NEWLINE
+
 
 class PrintLogicController:
     """
@@ -30,147 +44,148 @@ class PrintLogicController:
         self.logger = get_logger("PrintLogicController")
         self.messenger = messenger
         self.print_window = print_window
+        self._pending_notifications: list[tuple[str, str]] = []
+        self._active_triggers: list[str] = []
+
+        # 📌 Output and trigger paths are static, resolve them once
+        self._product_out = self._config_path("ProductPaths", "output_file_path_product")
+        self._c4_out = self._config_path("Control4Paths", "output_file_path_c4_product")
+        self._my2n_out = self._config_path("My2nPaths", "output_file_path_my2n")
+        self._trigger_dir = self._config_path("Paths", "trigger_path")
+        self._trigger_dir_exists = self._trigger_dir is not None and self._trigger_dir.exists()
 
     def product_save_and_print(self, header: str, record: str, trigger_values: list[str]) -> None:
         """
         Saves product header and record to output file and creates trigger files.
-
-        Handles file overwrite and error reporting.
         """
-        raw_output_path = self.config.get("ProductPaths", "output_file_path_product")
-        if not raw_output_path:
-            self.logger.warning("Cesta k výstupnímu souboru product nebyla nalezena.")
-            self.messenger.warning("Cesta k výstupnímu souboru product nebyla nalezena.", "Print Logic Ctrl")
-            self.print_window.reset_input_focus()
-            return
-
-        output_path = Path(raw_output_path)
-
-        try:
-            # 🧹 Delete the file if it exists
-            if output_path.exists():
-                try:
-                    output_path.unlink()
-                    self.logger.info("Starý soubor byl smazán: %s", output_path)
-                except Exception as delete_error:
-                    self.logger.warning("Nepodařilo se smazat soubor %s: %s", output_path, str(delete_error))
-
-            with output_path.open("w") as file:
-                file.write(header + "\n")
-                file.write(record + "\n")
-
-            trigger_dir = self._get_trigger_dir()
-            if not trigger_dir:
-                return
-
-            for value in trigger_values:
-                target_file = trigger_dir / value
-                target_file.touch(exist_ok=True)
-
-        except Exception as e:
-            self.logger.error("Chyba zápisu: %s", str(e))
-            self.messenger.error(f"Chyba zápisu: {str(e)}", "Print Logic Ctrl")
-            self.print_window.reset_input_focus()
+        data = f"{header}{_NEWLINE}{record}{_NEWLINE}"
+        self._save_and_print(self._product_out, data, trigger_values, "product", level="warning")
 
     def control4_save_and_print(self, header: str, record: str, trigger_values: list[str]) -> None:
         """
         Saves Control4 header and record to output file and creates trigger files.
+        """
+        data = f"{header}{_NEWLINE}{record}{_NEWLINE}"
+        self._save_and_print(self._c4_out, data, trigger_values, "Control4")
 
-        Handles file overwrite and error reporting.
+    def my2n_save_and_print(self, serial_number: str, token: str) -> None:
         """
-        raw_output_path = self.config.get("Control4Paths", "output_file_path_c4_product")
-        if not raw_output_path:
-            self.logger.error("Cesta k výstupnímu souboru Control4 nebyla nalezena.")
-            self.messenger.error("Cesta k výstupnímu souboru Control4 nebyla nalezena.", "Print Logic Ctrl")
-            self.print_window.reset_input_focus()
-            return
+        Saves My2N serial number and token to output file and creates trigger file.
+        """
+        record = f'"Serial number:","My2N Security Code:","{serial_number}","{token}"{_NEWLINE}'
+        self._save_and_print(self._my2n_out, _MY2N_HEADER + record, ["SF_MY2N_A"], "My2N")
 
-        output_path = Path(raw_output_path)
+    def _save_and_print(self, output_path: Path | None, data: str, trigger_values: list[str], label: str, level: str = "error") -> None:
+        """
+        Writes output file and creates trigger files (shared flow for all product types).
+
+        Handles file overwrite, missing paths, and error reporting.
+        """
+        if output_path is None:
+            message = f"Cesta k výstupnímu souboru {label} nebyla nalezena."
+            getattr(self.logger, level)(message)
+            self._notify(message, level)
+            return
 
         try:
-            # 🧹 Delete the file if it exists
-            if output_path.exists():
-                try:
-                    output_path.unlink()
-                    self.logger.info("Starý soubor byl smazán: %s", output_path)
-                except Exception as delete_error:
-                    self.logger.warning("Nepodařilo se smazat soubor %s: %s", output_path, str(delete_error))
-
-            with output_path.open("w") as file:
-                file.write(header + "\n")
-                file.write(record + "\n")
+            # 💡 Encoded inside the try, so an unencodable character is reported as a write error
+            self._write_output(output_path, data.encode(_OUTPUT_ENCODING))
+            self.logger.info("Soubor přepsán: %s", output_path)
 
             trigger_dir = self._get_trigger_dir()
             if not trigger_dir:
                 return
 
-            for value in trigger_values:
-                target_file = trigger_dir / value
-                target_file.touch(exist_ok=True)
+            self._create_triggers(trigger_dir, trigger_values)
 
         except Exception as e:
-            self.logger.error("Chyba zápisu: %s", str(e))
-            self.messenger.error(f"Chyba zápisu: {str(e)}", "Print Logic Ctrl")
-            self.print_window.reset_input_focus()
+            self.logger.error("Chyba zápisu: %s", e)
+            self._notify(f"Chyba zápisu: {str(e)}")
 
-    def my2n_save_and_print(self, serial_number: str, token: str) -> None:
+    @staticmethod
+    def _write_output(output_path: Path, data: bytes) -> None:
         """
-        Saves My2N serial number and token to output file and creates trigger file.
+        Writes output file with a single write() and flushes it to disk.
 
-        Handles file overwrite and error reporting.
+        BarTender reads the file as soon as a trigger appears, so the data
+        must be complete on disk before the triggers are created.
         """
-        raw_output_path = self.config.get("My2nPaths", "output_file_path_my2n")
-        if not raw_output_path:
-            self.logger.error("Cesta k výstupnímu souboru My2N nebyla nalezena.")
-            self.messenger.error("Cesta k výstupnímu souboru My2N nebyla nalezena.", "Print Logic Ctrl")
-            self.print_window.reset_input_focus()
-            return
+        fd = os.open(output_path, _OUTPUT_FLAGS, 0o666)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
-        output_path = Path(raw_output_path)
+    def _create_triggers(self, trigger_dir: Path, trigger_values: list[str]) -> None:
+        """
+        Creates trigger files with a bare open/close per value and remembers them.
 
-        try:
-            # 🧹 Delete the file if it exists
-            if output_path.exists():
-                try:
-                    output_path.unlink()
-                    self.logger.info("Starý soubor byl smazán: %s", output_path)
-                except Exception as delete_error:
-                    self.logger.warning("Nepodařilo se smazat soubor %s: %s", output_path, str(delete_error))
-
-            with output_path.open("w") as file:
-                file.write('"L Vyrobni cislo dlouhe","L Bezpecnostni cislo","P Vyrobni cislo","P Bezpecnostni kod"\n')
-                file.write(f'"Serial number:","My2N Security Code:","{serial_number}","{token}"\n')
+        Skips the Path construction and utime call done by Path.touch().
+        """
+        prefix = str(trigger_dir) + os.sep
+        for value in trigger_values:
+            trigger_path = prefix + value
+            os.close(os.open(trigger_path, _TRIGGER_FLAGS, 0o666))
+            self._active_triggers.append(trigger_path)
 
-            trigger_dir = self._get_trigger_dir()
-            if not trigger_dir:
-                return
+    def reset_active_triggers(self) -> None:
+        """
+        Forgets trigger files from the previous print.
+        """
+        self._active_triggers = []
 
-            trigger_file = trigger_dir / "SF_MY2N_A"
-            trigger_file.touch(exist_ok=True)
+    def triggers_pending(self) -> bool:
+        """
+        Returns True while any trigger file from the last print still exists.
 
-        except Exception as e:
-            self.logger.error("Chyba zápisu: %s", str(e))
-            self.messenger.error(f"Chyba zápisu: {str(e)}", "Print Logic Ctrl")
-            self.print_window.reset_input_focus()
+        BarTender Commander removes trigger files once it has processed them.
+        """
+        return any(os.path.exists(path) for path in self._active_triggers)
+
+    def _config_path(self, section: str, key: str) -> Path | None:
+        """
+        Returns configured path as Path, or None if the value is missing.
+        """
+        raw_path = self.config.get(section, key, fallback="")
+        return Path(raw_path) if raw_path else None
 
     def _get_trigger_dir(self) -> Path | None:
         """
-        Retrieves and validates trigger directory path from config.
+        Returns trigger directory path resolved at construction.
 
         Returns None if path is missing or invalid.
         """
-        raw_path = self.config.get("Paths", "trigger_path")
-        if not raw_path:
+        if self._trigger_dir is None:
             self.logger.error("Trigger path není definován.")
-            self.messenger.error("Trigger path není definován.", "Print Logic Ctrl")
-            self.print_window.reset_input_focus()
+            self._notify("Trigger path není definován.")
             return None
 
-        path = Path(raw_path)
-        if not path.exists():
-            self.logger.error("Trigger složka neexistuje: %s", str(path))
-            self.messenger.error(f"Trigger složka neexistuje: {path}", "Print Logic Ctrl")
-            self.print_window.reset_input_focus()
+        if not self._trigger_dir_exists:
+            self.logger.error("Trigger složka neexistuje: %s", self._trigger_dir)
+            self._notify(f"Trigger složka neexistuje: {self._trigger_dir}")
             return None
 
-        return path
+        return self._trigger_dir
+
+    def _notify(self, message: str, level: str = "error") -> None:
+        """
+        Shows user feedback, deferring it when called from a worker thread.
+
+        Qt widgets may only be touched from the GUI thread, so messages raised
+        during parallel writes are queued and shown by flush_notifications().
+        """
+        if threading.current_thread() is threading.main_thread():
+            getattr(self.messenger, level)(message, "Print Logic Ctrl")
+            self.print_window.reset_input_focus()
+        else:
+            self._pending_notifications.append((level, message))
+
+    def flush_notifications(self) -> None:
+        """
+        Shows feedback queued by worker threads. Must be called from the GUI thread.
+        """
+        while self._pending_notifications:
+            level, message = self._pending_notifications.pop(0)
+            getattr(self.messenger, level)(message, "Print Logic Ctrl")
+            self.print_window.reset_input_focus()
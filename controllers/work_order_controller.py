@@ -8,21 +8,43 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
-import configparser
+import re
+import functools
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # 🧩 Third-party libraries
-from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtCore import QCoreApplication, QObject, Qt, QTimer, pyqtSignal
 
 # 🧠 First-party (project-specific)
 from utils.logger import get_logger
 from utils.messenger import Messenger
 from utils.resources import get_config_path
-from utils.order_data import OrderData
+from utils.config_cache import load_config
+from utils.order_data import OrderData, ORDER_FILE_ENCODING
 from utils.app_services import AppServices
 
 from views.work_order_window import WorkOrderWindow
 
+# 📌 .NOR header: "$<order code>;<product name>;..." – both fields captured in one pass
+_NOR_HEADER = re.compile(r"\$*([^;]*);([^;]*)")
+
+
+@functools.cache
+def _get_print_controller_cls():
+    """
+    Returns PrintController class, importing it only on the first call (avoids circular import).
+    """
+    from controllers.print_controller import PrintController
+    return PrintController
+
+
+class _OrderFilesRead(QObject):
+    """
+    Carries the result of the background .nor/.lbl read back to the GUI thread.
+    """
+    finished = pyqtSignal(str, object, object)
+
 
 class WorkOrderController:
     """
@@ -37,9 +59,7 @@ class WorkOrderController:
         """
         # 📌 Loading the configuration file
         config_path = get_config_path("config.ini")
-        self.config = configparser.ConfigParser()
-        self.config.optionxform = str  # 💡 Ensures letter size is maintained
-        self.config.read(config_path)
+        self.config = load_config(config_path)
 
         # 📌 Initialization
         self.window_stack = window_stack
@@ -51,6 +71,11 @@ class WorkOrderController:
         self.logger = get_logger("WorkOrderController")
         self.services = AppServices(config=self.config, messenger=self.messenger)
 
+        # 📌 Background file reads, results are delivered to the GUI thread through a queued signal
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._files_read = _OrderFilesRead()
+        self._files_read.finished.connect(self._on_order_files_read, Qt.ConnectionType.QueuedConnection)
+
         # 📌 Linking the button to the method
         self.work_order_window.next_button.clicked.connect(self.work_order_button_click)
         self.work_order_window.back_button.clicked.connect(self.handle_back)
@@ -60,8 +85,8 @@ class WorkOrderController:
         """
         Triggered on "Continue" click.
 
-        Validates input, checks file existence, parses .nor file,
-        and launches PrintController if all checks pass.
+        Validates input and reads the .nor/.lbl files on a worker thread,
+        the result is processed by _on_order_files_read back on the GUI thread.
         """
         # 📌 Processing of input
         value_input = self.work_order_window.work_order_input.text().strip().upper()
@@ -73,74 +98,113 @@ class WorkOrderController:
         # 📁 Construct paths
         self.order_data.set_files(value_input)
 
-        # ❌ If file not found
-        if not self.order_data.lbl_file.exists() or not self.order_data.nor_file.exists():
-            self.order_data.lines = []
-            self.logger.warning("Soubor %s nebo %s nebyl nalezen!", self.order_data.lbl_file, self.order_data.nor_file)
-            self.messenger.warning(f"Soubor {self.order_data.lbl_file} nebo {self.order_data.nor_file} nebyl nalezen!", "Work Order Ctrl")
-            self.reset_input_focus()
-            return
-
-        try:
-            with self.order_data.nor_file.open("r") as file:
-                first_line = file.readline().strip()
-                parts = first_line.split(";")
+        # 📌 Files on T:/ may be slow, keep the GUI thread free while they are read
+        self.work_order_window.disable_inputs()
+        self.executor.submit(self._read_order_files, value_input, self.order_data.nor_file, self.order_data.lbl_file)
 
-                if len(parts) >= 2:
-                    nor_order_code = parts[0].lstrip("$").upper()
-                    product_name = parts[1].strip()
-
-                    if nor_order_code != value_input:
-                        self.logger.warning("Výrobní příkaz v souboru .NOR (%s) neodpovídá zadanému vstupu (%s)!", nor_order_code, value_input)
-                        self.messenger.warning(f"Výrobní příkaz v souboru .NOR ({nor_order_code}) neodpovídá zadanému vstupu ({value_input})!", "Work Order Ctrl")
-                        self.reset_input_focus()
-                        return
+    def _read_order_files(self, value_input: str, nor_file: Path, lbl_file: Path):
+        """
+        Reads the .nor header and the .lbl lines (runs on a worker thread).
 
-                    groups = self.services.config_controller.get_trigger_groups_for_product(product_name)
-                    if not groups:
-                        self.logger.info("Zpracování zastaveno – produkt není mapován v configu.")
-                        self.reset_input_focus()
-                        return
+        Read errors are passed on in place of data, the GUI thread reports them.
+        """
+        try:
+            # 📌 Only the first two fields of the first line are needed, one small raw read is enough
+            with open(nor_file, "rb", buffering=0) as file:
+                head = file.read(512)
+        except OSError as e:
+            head = e
+
+        lbl_lines = None
+        if not isinstance(head, Exception):
+            try:
+                # 📌 Unbuffered read slurps the whole file without BufferedReader/TextIOWrapper layers
+                with open(lbl_file, "rb", buffering=0) as file:
+                    lbl_lines = file.read().decode(ORDER_FILE_ENCODING).splitlines()
+            except (OSError, ValueError) as e:
+                lbl_lines = e
+
+        self._files_read.finished.emit(value_input, head, lbl_lines)
+
+    def _on_order_files_read(self, value_input: str, head, lbl_lines):
+        """
+        Parses the .nor header, checks product mapping and launches PrintController.
 
-                    self.order_data.lines = self.load_file(self.order_data.lbl_file)
+        Runs on the GUI thread once _read_order_files has finished.
+        """
+        self.work_order_window.restore_inputs()
 
-                    bartender = self.services.bartender_cls(messenger=self.messenger, config=self.config)
-                    bartender.run_commander()
+        try:
+            # ❌ If file not found (open failed, no separate exists() probe)
+            if isinstance(head, FileNotFoundError):
+                self.order_data.lines = []
+                self.logger.warning("Soubor %s nebyl nalezen!", self.order_data.nor_file)
+                self.messenger.warning(f"Soubor {self.order_data.nor_file} nebyl nalezen!", "Work Order Ctrl")
+                self.reset_input_focus()
+                return
+            if isinstance(head, Exception):
+                raise head
+
+            first_line = head.split(b"\n", 1)[0].decode(ORDER_FILE_ENCODING).strip()
+            header = _NOR_HEADER.match(first_line)
+
+            if header:
+                nor_order_code = header.group(1).upper()
+                product_name = header.group(2).strip()
+
+                if nor_order_code != value_input:
+                    self.logger.warning("Výrobní příkaz v souboru .NOR (%s) neodpovídá zadanému vstupu (%s)!", nor_order_code, value_input)
+                    self.messenger.warning(f"Výrobní příkaz v souboru .NOR ({nor_order_code}) neodpovídá zadanému vstupu ({value_input})!", "Work Order Ctrl")
+                    self.reset_input_focus()
+                    return
 
-                    self.open_app_window(order_code=value_input, product_name=product_name)
-                    self.logger.info("Příkaz: %s", value_input)
+                groups = self.services.config_controller.get_trigger_groups_for_product(product_name)
+                if not groups:
+                    self.logger.info("Zpracování zastaveno – produkt není mapován v configu.")
                     self.reset_input_focus()
+                    return
 
-                else:
-                    self.logger.warning("Řádek v souboru %s nemá očekávaný formát.", self.order_data.nor_file)
-                    self.messenger.warning(f"Řádek v souboru {self.order_data.nor_file} nemá očekávaný formát.", "Work Order Ctrl")
+                # ❌ A missing .lbl stops the flow, as the former exists() check did
+                if isinstance(lbl_lines, FileNotFoundError):
+                    self.order_data.lines = []
+                    self.logger.warning("Soubor %s nebyl nalezen!", self.order_data.lbl_file)
+                    self.messenger.warning(f"Soubor {self.order_data.lbl_file} nebyl nalezen!", "Work Order Ctrl")
                     self.reset_input_focus()
                     return
+
+                # 📌 An unreadable .lbl is reported but not fatal (My2N-only products need no lines)
+                if isinstance(lbl_lines, Exception):
+                    self.logger.error("Soubor %s se nepodařilo načíst: %s", self.order_data.lbl_file, lbl_lines)
+                    self.messenger.error(f"Soubor {self.order_data.lbl_file} se nepodařilo načíst: {lbl_lines}", "Work Order Ctrl")
+                    lbl_lines = []
+
+                self.order_data.lines = lbl_lines
+
+                # 📌 Launch Commander on the next event loop pass, after the print window is shown
+                bartender = self.services.bartender_cls(messenger=self.messenger, config=self.config)
+                QTimer.singleShot(0, bartender.run_commander)
+
+                self.open_app_window(order_code=value_input, product_name=product_name)
+                self.logger.info("Příkaz: %s", value_input)
+                self.reset_input_focus()
+
+            else:
+                self.logger.warning("Řádek v souboru %s nemá očekávaný formát.", self.order_data.nor_file)
+                self.messenger.warning(f"Řádek v souboru {self.order_data.nor_file} nemá očekávaný formát.", "Work Order Ctrl")
+                self.reset_input_focus()
+                return
         except Exception as e:
-            self.logger.error("Neočekávaná chyba při zpracování .NOR souboru: %s", str(e))
+            self.logger.error("Neočekávaná chyba při zpracování .NOR souboru: %s", e)
             self.messenger.error(f"Neočekávaná chyba při zpracování .NOR souboru: {e}", "Work Order Ctrl")
             self.reset_input_focus()
             return
 
-    def load_file(self, file_path: Path) -> list[str]:
-        """
-        Reads lines from a given file path.
-
-        Returns empty list on error.
-        """
-        try:
-            return file_path.read_text().splitlines()
-        except Exception as e:
-            self.logger.error("Soubor %s se nepodařilo načíst: %s", file_path, str(e))
-            self.messenger.error(f"Soubor {file_path} se nepodařilo načíst: {e}", "Work Order Ctrl")
-            return []
-
     def open_app_window(self, order_code, product_name):
         """
         Instantiates PrintController and opens the print window.
         """
-        from controllers.print_controller import PrintController
-        self.print_controller = PrintController(self.window_stack, order_code, product_name)
+        print_controller_cls = _get_print_controller_cls()
+        self.print_controller = print_controller_cls(self.window_stack, order_code, product_name)
         self.window_stack.push(self.print_controller.print_window)
 
     def reset_input_focus(self):
@@ -156,6 +220,7 @@ class WorkOrderController:
         """
         bartender = self.services.bartender_cls(messenger=self.messenger, config=self.config)
         bartender.kill_processes()
+        self.executor.shutdown(wait=False)
         self.work_order_window.effects.fade_out(self.work_order_window)
 
     def handle_exit(self):
@@ -165,5 +230,6 @@ class WorkOrderController:
         self.logger.info("Aplikace byla ukončena uživatelem.")
         bartender = self.services.bartender_cls(messenger=self.messenger, config=self.config)
         bartender.kill_processes()
+        self.executor.shutdown(wait=False)
         self.window_stack.mark_exiting()
         self.work_order_window.effects.fade_out(self.work_order_window, callback=QCoreApplication.instance().quit)
@@ -5,7 +5,7 @@ Handles login verification by decrypting credentials stored in an encrypted file
 
 Provides functionality to:
 - Decode login data using XOR-based decryption
-- Verify user passwords against SHA-256 hashes
+- Verify user passwords against BLAKE2b digests
 - Extract user metadata upon successful login
 
 Used by LoginController during authentication.
@@ -14,45 +14,54 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
-import configparser
-import hashlib
-from pathlib import Path
+import os
+from hashlib import blake2b
+from binascii import unhexlify
 
 # 🧠 First-party (project-specific)
 from utils.logger import get_logger
 from utils.messenger import Messenger
 from utils.resources import get_config_path, resolve_path
+from utils.config_cache import load_config
 
-# 📌 Global variable holding the value prefix
-VALUE_PREFIX = None
+# 📌 32-byte XOR key blocks, one per (line length % 32) start offset
+_KEY_BLOCKS = tuple(bytes(((start + 5 * i) % 32) ^ 0x6 for i in range(32)) for start in range(32))
 
 
 def get_value_prefix():
     """
-    Returns the current global value prefix after successful login.
+    Returns the value prefix of the last successful login.
     """
-    return VALUE_PREFIX
+    return SzvDecrypt.VALUE_PREFIX
 
 
 class SzvDecrypt:
     """
     Decrypts login credentials and verifies user authentication.
-    Uses XOR decoding and SHA-256 matching to validate passwords and extract user metadata.
+    Uses XOR decoding and BLAKE2b matching to validate passwords and extract user metadata.
     """
 
-    def __init__(self, config_file='config.ini'):
+    # 📌 Value prefix of the last successful login (shared by all instances)
+    VALUE_PREFIX: str | None = None
+
+    # 📌 Decoded credentials shared across instances, keyed by (path, mtime_ns, size)
+    _decode_cache: dict[tuple[str, int, int], dict[bytes, str]] = {}
+
+    def __init__(self, config_file='config.ini', szv_input_file=None):
         """
-        Initializes decryption logic, loads config, and prepares messenger and logger.
+        Initializes decryption logic, resolves the SZV file path, and prepares messenger and logger.
+
+        Args:
+            config_file (str): Config file to read the SZV path from when none is given.
+            szv_input_file (Path | None): Already resolved SZV file path (skips the config lookup).
         """
-        # 📌 Loading the configuration file
-        config_path = get_config_path(config_file)
-        self.config = configparser.ConfigParser()
-        self.config.optionxform = str  # 💡 Ensures letter size is maintained
-        self.config.read(config_path)
+        # 📌 Loading the configuration file only when the caller did not resolve the path
+        if szv_input_file is None:
+            config = load_config(get_config_path(config_file))
+            szv_input_file = resolve_path(config.get('Paths', 'szv_input_file'))
 
         # 📌 Initialization
-        raw_path = self.config.get('Paths', 'szv_input_file')
-        self.szv_input_file = resolve_path(raw_path)
+        self.szv_input_file = szv_input_file
         self.logger = get_logger("SzvDecrypt")
         self.messenger = Messenger()
         self.value_surname = None
@@ -64,49 +73,47 @@ class SzvDecrypt:
         """
         Decodes a single encrypted line using XOR logic.
 
+        The key stream ((len % 32) + 5 * i) % 32 ^ 0x6 repeats every 32 bytes,
+        so the precomputed block is tiled and applied to the whole line with one big-integer XOR.
+
         Returns decoded segments split by delimiter.
         """
-        int_xor = len(encoded_data) % 32
-        decoded_data = bytearray(len(encoded_data))
-
-        for i, byte in enumerate(encoded_data):
-            decoded_data[i] = byte ^ (int_xor ^ 0x6)
-            int_xor = (int_xor + 5) % 32
+        length = len(encoded_data)
+        key = (_KEY_BLOCKS[length % 32] * (length // 32 + 1))[:length]
 
-        return decoded_data.decode('windows-1250').split('\x15')
+        decoded = int.from_bytes(encoded_data, "little") ^ int.from_bytes(key, "little")
+        return decoded.to_bytes(length, "little").decode('windows-1250').split('\x15')
 
     def check_login(self, password):
         """
         Verifies input password against stored credentials.
-        Updates global prefix and user metadata on success.
+        Updates shared prefix and user metadata on success.
         """
-        # pylint: disable=global-statement
-        global VALUE_PREFIX  # ✅ Allows you to modify a global variable
         try:
             decoded_data = self.decoding_file()
-            hashed_password = hashlib.sha256(password.encode()).hexdigest()
-            for decoded_line in decoded_data:  # type: ignore
-                if hashed_password == decoded_line[0]:
-                    if len(decoded_line) > 1:
-                        parts = decoded_line[1].split(',')
-                        if len(parts) >= 4:
-                            self.value_surname = parts[2].strip()
-                            self.value_name = parts[3].strip()
-                            self.value_prefix = parts[4].strip()
-                            # pylint: disable=global-statement
-                            global VALUE_PREFIX
-                            VALUE_PREFIX = self.value_prefix  # ✅ Updating a global variable
-                            self.logger.info("Logged: %s %s %s", self.value_surname, self.value_name, self.value_prefix)
-                            return True
-                        self.logger.warning("Řádek neobsahuje dostatek částí: %s", decoded_line[1])
-                        return False
-                    self.logger.warning("Řádek neobsahuje další části: %s", decoded_line)
-                    return False
-            self.logger.warning("Zadané heslo (%s) nebylo nalezeno v souboru (%s).", password, self.szv_input_file)
+            if decoded_data is False:
+                return False  # ❌ Read error was already reported by decoding_file
+
+            # 📌 O(1) lookup by password hash instead of scanning every decoded line
+            hashed_password = blake2b(password.encode(), digest_size=32).digest()
+            decoded_line = decoded_data.get(hashed_password)
+            if decoded_line is None:
+                self.logger.warning("Zadané heslo (%s) nebylo nalezeno v souboru (%s).", password, self.szv_input_file)
+                return False
+
+            parts = decoded_line.split(',')
+            if len(parts) >= 4:
+                self.value_surname = parts[2].strip()
+                self.value_name = parts[3].strip()
+                self.value_prefix = parts[4].strip()
+                SzvDecrypt.VALUE_PREFIX = self.value_prefix  # ✅ Updating the shared prefix
+                self.logger.info("Logged: %s %s %s", self.value_surname, self.value_name, self.value_prefix)
+                return True
+            self.logger.warning("Řádek neobsahuje dostatek částí: %s", decoded_line)
             return False
 
         except (FileNotFoundError, ValueError, IndexError, AttributeError) as e:
-            self.logger.error("Neočekávaná chyba při ověřování hesla: %s", str(e))
+            self.logger.error("Neočekávaná chyba při ověřování hesla: %s", e)
             self.messenger.error(f"{str(e)}", "Přihlášení")
             return False
 
@@ -114,18 +121,30 @@ class SzvDecrypt:
         """
         Reads and decodes all lines from the encrypted login file.
 
-        Returns list of decoded entries or False on error.
+        The result is cached until the file's mtime or size changes.
+
+        Returns dict of password hash → decoded line or False on error.
         """
-        decoded_lines = []
+        decoded_lines = {}
         try:
-            with Path(self.szv_input_file).open('r') as infile:
-                for line in infile:
-                    byte_array = bytearray.fromhex(line.strip())
-                    decoded_line = self.decoding_line(byte_array)
-                    decoded_lines.append([hashlib.sha256(decoded_line[0].encode()).hexdigest(), ','.join(decoded_line)])
+            stat = os.stat(self.szv_input_file)
+            cache_key = (str(self.szv_input_file), stat.st_mtime_ns, stat.st_size)
+            cached = SzvDecrypt._decode_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # 📌 Hex lines are ASCII, read raw bytes and unhexlify them without a text decode layer
+            with open(self.szv_input_file, 'rb') as infile:
+                data = infile.read()
+            for line in data.split():
+                decoded_line = self.decoding_line(unhexlify(line))
+                # 📌 setdefault keeps the first line for a duplicate hash, as the former linear scan did
+                decoded_lines.setdefault(blake2b(decoded_line[0].encode(), digest_size=32).digest(), ','.join(decoded_line))
         except (FileNotFoundError, ValueError, OSError, IndexError, AttributeError) as e:
-            self.logger.error("Při čtení souboru došlo k chybě: %s", str(e))
+            self.logger.error("Při čtení souboru došlo k chybě: %s", e)
             self.messenger.error(f"{str(e)}", "Přihlášení")
             return False
 
+        SzvDecrypt._decode_cache.clear()
+        SzvDecrypt._decode_cache[cache_key] = decoded_lines
         return decoded_lines
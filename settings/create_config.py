@@ -1,7 +1,7 @@
 # 🛠️ create_config.py – Generates default configuration file for the application
 
+import sys
 import configparser
-from io import StringIO
 
 config = configparser.ConfigParser()
 config.optionxform = str  # ✅ Preserve key casing
@@ -44,11 +44,9 @@ config["ProductTriggerMapping"] = {
     "my2n": "9151301, 9151301C, 9151301CK, 9151301CM, 9151301CRP, 9151301K, 9151301RP, 9151302CR, 9151302R, 9151304, 9151304C",
 }
 
-# 🧪 For testing: preview config content
-configfile = StringIO()
-config.write(configfile)
-print(configfile.getvalue())
-
 # 💾 Save config to .ini file
 with open("config.ini", mode="w") as file:
-    file.write(configfile.getvalue())
+    config.write(file)
+
+# 🧪 For testing: preview config content
+config.write(sys.stdout)
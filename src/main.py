@@ -15,10 +15,11 @@ Author: Miloslav Hradecky
 __version__ = "4.1.0.0"
 
 # 🧱 Standard library
+import os
 import sys
-from configparser import ConfigParser
 
 # 🧩 Third-party libraries
+from PyQt6.QtCore import QFile, QIODevice, QTextStream
 from PyQt6.QtWidgets import QApplication
 
 # 🧠 First-party (project-specific)
@@ -32,7 +33,7 @@ from utils.ensure_logs_dir import ensure_logs_dir
 from utils.resources import resource_path, get_writable_path
 from utils.system_info import log_system_info
 from utils.config_checker import ConfigFileChecker
-from utils.single_instance import SingleInstanceChecker
+from utils.single_instance import get_checker
 from utils.messenger import Messenger
 from utils.path_validation import PathValidator
 from utils.logger import get_logger
@@ -56,6 +57,7 @@ class AppLauncher:
         self.logger = get_logger("Main")
         self.window_stack = WindowStackManager()
         self.app = None
+        self.instance_checker = None
 
     def run(self):
         """
@@ -77,18 +79,22 @@ class AppLauncher:
         Adds a blank line to the TXT log for visual separation.
         """
         try:
-            log_file_txt = get_writable_path("logs/app.txt")
-            with open(log_file_txt, "a", encoding="utf-8") as f:
-                f.write("\n")
-        except (OSError, IOError) as e:
+            # 📌 One raw append, no buffered text-file layer for a single byte
+            fd = os.open(get_writable_path("logs/app.txt"), os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+            try:
+                os.write(fd, b"\n")
+            finally:
+                os.close(fd)
+        except OSError as e:
             self.logger.warning("Nepodařilo se zapsat prázdný řádek do logu: %s", e)
 
     def _check_single_instance(self):
         """
         Ensures that only one instance of the application is running.
         """
-        checker = SingleInstanceChecker("LinebUniqueAppKey")
-        if checker.is_running():
+        # 📌 Kept on the launcher, the shared memory segment lives until the process exits
+        self.instance_checker = get_checker("LinebUniqueAppKey")
+        if self.instance_checker.is_running():
             self.app = QApplication([])
             Messenger(None).error("Upozornění - Aplikace už běží!", "Main")
             sys.exit(0)
@@ -103,10 +109,11 @@ class AppLauncher:
         """
         Applies the global stylesheet if available.
         """
-        style_path = resource_path("views/themes/style.qss")
-        if style_path.exists():
-            with open(style_path, encoding="utf-8") as f:
-                self.app.setStyleSheet(f.read())
+        # 📌 QFile/QTextStream read straight into a QString, a failed open() covers a missing file
+        style_file = QFile(str(resource_path("views/themes/style.qss")))
+        if style_file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+            self.app.setStyleSheet(QTextStream(style_file).readAll())
+            style_file.close()
 
     def _check_config_file(self):  # noqa: method may use self.logger in future
         """
@@ -119,8 +126,6 @@ class AppLauncher:
         """
         Validates paths defined in the configuration file.
         """
-        config = ConfigParser()
-        config.read("config.ini")
         validator = PathValidator()
         if not validator.validate():
             Messenger(None).error("Konfigurace obsahuje neplatné cesty. Aplikace bude ukončena.", "Main")
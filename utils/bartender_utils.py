@@ -8,12 +8,25 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
-import time
 import subprocess
 
+# 🧩 Third-party libraries
+from PyQt6.QtCore import QTimer
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # 🧠 First-party (project-specific)
 from utils.logger import get_logger
 
+# 📌 Process images terminated by kill_processes
+_BARTENDER_IMAGES = ("Commander.exe", "Guardian.exe", "bartend.exe")
+
+# 📌 Launched tools run detached, without inheriting the UI process console or handles
+_DETACHED_FLAGS = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+
 
 class BartenderUtils:
     """
@@ -21,6 +34,10 @@ class BartenderUtils:
     Provides methods to kill, launch, and monitor BarTender components.
     """
 
+    # 📌 Shared across instances: pending Guardian launch and a counter bumped by every kill
+    _guardian_timer: QTimer | None = None
+    _kill_generation: int = 0
+
     def __init__(self, messenger=None, config=None):
         """
         Initializes the utility with optional Messenger for user feedback.
@@ -36,31 +53,51 @@ class BartenderUtils:
     def kill_processes(self):
         """
         Terminates all running BarTender instances (Commander.exe, Guardian.exe and bartend.exe).
+
+        Kills the processes directly via psutil; falls back to taskkill if psutil is unavailable.
+        A Guardian launch still waiting on its timer is cancelled as well.
         """
+        self._cancel_pending_guardian()
+        BartenderUtils._kill_generation += 1
+
+        if psutil is not None:
+            self._kill_with_psutil()
+            return
+
         try:
+            # 📌 taskkill accepts multiple /im filters in a single process
+            argv = ["taskkill", "/f"]
+            for image in _BARTENDER_IMAGES:
+                argv += ["/im", image]
             subprocess.run(
-                "taskkill /f /im Commander.exe 1>nul 2>nul",
-                shell=True,
+                argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
-            subprocess.run(
-                "taskkill /f /im Guardian.exe 1>nul 2>nul",
-                shell=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            subprocess.run(
-                "taskkill /f /im bartend.exe 1>nul 2>nul",
-                shell=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-        except subprocess.CalledProcessError as e:
-            self.logger.error("Chyba při ukončování BarTender procesů: %s", str(e))
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.error("Chyba při ukončování BarTender procesů: %s", e)
             if self.messenger:
                 self.messenger.error(
                     f"Chyba při ukončování BarTender procesů: {str(e)}",
                     "Bartender Utils"
                 )
 
+    def _kill_with_psutil(self):
+        """
+        Kills matching BarTender processes without spawning any helper process.
+        """
+        targets = {image.lower() for image in _BARTENDER_IMAGES}
+        for process in psutil.process_iter(["name"]):
+            if (process.info["name"] or "").lower() not in targets:
+                continue
+            try:
+                process.kill()
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.AccessDenied as e:
+                self.logger.warning("Proces %s nelze ukončit: %s", process.info["name"], e)
+
     def run_commander(self):
         """
         Launches BarTender Commander using configured paths.
@@ -90,22 +127,72 @@ class BartenderUtils:
             # pylint: disable=consider-using-with
             commander_process = subprocess.Popen(
                 [str(commander_path), "/START", "/MIN=SystemTray", "/NOSPLASH"],
-                shell=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                creationflags=_DETACHED_FLAGS
             )
             self.logger.info("Commander spuštěn: PID %s", commander_process.pid)
 
-            time.sleep(1)
+            # ⏱️ Give Commander a head start without blocking the event loop
+            self._schedule_guardian(guardian_path)
+
+        except Exception as e:
+            self.logger.error("Chyba při spuštění Commanderu: %s", e)
+            if self.messenger:
+                self.messenger.error(
+                    f"Chyba při spuštění Commanderu: {str(e)}",
+                    "Bartender Utils"
+                )
 
+    def _schedule_guardian(self, guardian_path: str):
+        """
+        Starts a cancellable one-second timer that launches Guardian after Commander.
+        """
+        self._cancel_pending_guardian()
+        generation = BartenderUtils._kill_generation
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: self._run_guardian(guardian_path, generation))
+        timer.start(1000)
+        BartenderUtils._guardian_timer = timer
+
+    @staticmethod
+    def _cancel_pending_guardian():
+        """
+        Stops the pending Guardian launch timer, if any.
+        """
+        timer = BartenderUtils._guardian_timer
+        if timer is not None:
+            timer.stop()
+            BartenderUtils._guardian_timer = None
+
+    def _run_guardian(self, guardian_path: str, generation: int):
+        """
+        Launches the Guardian watchdog once Commander has had time to start.
+
+        Skipped when kill_processes ran after the launch was scheduled.
+        """
+        BartenderUtils._guardian_timer = None
+        if generation != BartenderUtils._kill_generation:
+            self.logger.info("Spuštění Guardianu zrušeno, BarTender procesy byly mezitím ukončeny.")
+            return
+
+        try:
+            # pylint: disable=consider-using-with
             guardian_process = subprocess.Popen(
                 [str(guardian_path)],
-                shell=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                creationflags=_DETACHED_FLAGS
             )
             self.logger.info("Guardian watchdog spuštěn: PID %s", guardian_process.pid)
 
         except Exception as e:
-            self.logger.error("Chyba při spuštění Commanderu: %s", str(e))
+            self.logger.error("Chyba při spuštění Guardianu: %s", e)
             if self.messenger:
                 self.messenger.error(
-                    f"Chyba při spuštění Commanderu: {str(e)}",
+                    f"Chyba při spuštění Guardianu: {str(e)}",
                     "Bartender Utils"
                 )
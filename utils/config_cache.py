@@ -0,0 +1,57 @@
+"""
+📦 Module: config_cache.py
+
+Provides a shared, mtime-aware cache of parsed configuration files.
+
+Responsibilities:
+    - Parse config.ini once and reuse the ConfigParser across controllers
+    - Re-parse only when the file's modification time changes
+    - Preserve option letter case (optionxform = str)
+
+Author: Miloslav Hradecky
+"""
+
+# 🧱 Standard library
+import os
+import configparser
+from pathlib import Path
+
+# 📌 Cached parsers keyed by path → (mtime_ns, parser)
+_CONFIG_CACHE: dict[str, tuple[int, configparser.ConfigParser]] = {}
+
+
+def _parse(path: Path) -> configparser.ConfigParser:
+    """
+    Parses the given INI file with letter case preserved.
+    """
+    config = configparser.ConfigParser()
+    config.optionxform = str  # 💡 Ensures letter size is maintained
+    config.read(path)
+    return config
+
+
+def load_config(path: Path) -> configparser.ConfigParser:
+    """
+    Returns parsed configuration, re-reading the file only when it changed.
+
+    A missing file yields an empty parser (same as ConfigParser.read) and is not cached.
+
+    Args:
+        path (Path): Path to the INI file.
+
+    Returns:
+        ConfigParser: Parsed (possibly shared) configuration.
+    """
+    key = str(path)
+    try:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        return _parse(path)
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = _parse(path)
+    _CONFIG_CACHE[key] = (mtime, config)
+    return config
@@ -14,13 +14,22 @@ Author: Miloslav Hradecky
 # 🧠 First-party (project-specific)
 from utils.resources import get_writable_path
 
+# 📌 Directories already ensured in this process
+_ensured: set[str] = set()
+
 
 def ensure_logs_dir(path: str = "logs"):
     """
     Ensures that the logs directory exists. If not, creates it.
 
+    Each path is created at most once per process, later calls return immediately.
+
     Args:
         path (str): Relative or absolute path to the logs directory (default: "logs").
     """
+    if path in _ensured:
+        return
+
     logs_path = get_writable_path(path)
     logs_path.mkdir(parents=True, exist_ok=True)
+    _ensured.add(path)
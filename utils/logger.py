@@ -5,6 +5,9 @@ Utility for initializing and configuring application-wide logging.
 
 Responsibilities:
     - Provide rotating log handlers for both plain-text and JSON formats
+    - Write log records from a background thread via QueueHandler/QueueListener
+    - Buffer routine records in memory and flush them periodically or on warnings
+    - Skip the JSON log entirely when PACKINGLINE_JSON_LOG=0 is set
     - Format logs with timestamps, levels, and module names
     - Ensure log directory exists before writing
 
@@ -14,17 +17,54 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
+import os
+import time
+import atexit
+import functools
 import logging
 import json
+import queue
+import threading
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener, MemoryHandler
 
 # 🧠 First-party (project-specific)
 from utils.resources import get_writable_path
+from utils.ensure_logs_dir import ensure_logs_dir
+
+
+# 📌 Compact JSON output: constant key skeleton, encoder bound once at import
+_dumps = json.dumps
+_JSON_TEMPLATE = '{"timestamp":"%s","level":"%s","module":%s,"message":%s}'
+
+
+# --- Formatter with per-second timestamp cache ---
+class CachedTimeFormatter(logging.Formatter):
+    """
+    ⏱️ Formatter that renders the date/time part once per second.
+
+    Output is identical to logging.Formatter's default "YYYY-mm-dd HH:MM:SS,mmm";
+    records within the same second reuse the strftime result and only add milliseconds.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second: int | None = None
+        self._cached_prefix = ""
+
+    def formatTime(self, record, datefmt=None):  # noqa
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_prefix, record.msecs)
 
 
 # --- Custom JSON formatter ---
-class JsonFormatter(logging.Formatter):
+class JsonFormatter(CachedTimeFormatter):
     """
     🧾 Custom formatter for logging in JSON format.
 
@@ -32,19 +72,118 @@ class JsonFormatter(logging.Formatter):
     """
 
     def format(self, record):  # noqa
-        log_record = {
-            "timestamp": self.formatTime(record),
-            "level": record.levelname,
-            "module": record.name,
-            "message": record.getMessage()
-        }
-        return json.dumps(log_record, ensure_ascii=False)
+        # 📌 Fixed key skeleton; only the free-form values go through the JSON encoder
+        return _JSON_TEMPLATE % (
+            self.formatTime(record),
+            record.levelname,
+            _dumps(record.name, ensure_ascii=False),
+            _dumps(record.getMessage(), ensure_ascii=False),
+        )
+
+
+# --- Rotating handler with in-memory size tracking ---
+class SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """
+    🔁 RotatingFileHandler that keeps the file size in memory.
+
+    The stock handler seeks/tells the stream on every record; here the size is read
+    once after opening, then advanced by each record, and the exact check runs only near maxBytes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._size: int | None = None
+
+    def shouldRollover(self, record):  # noqa
+        if self.maxBytes <= 0:
+            return False
+
+        # 📌 Size unknown (fresh handler or just rotated) – ask the stream once
+        if self._size is None:
+            if self.stream is None:
+                self.stream = self._open()
+            self._size = self.stream.seek(0, 2)
+
+        # 💡 Count encoded bytes, Czech text takes more bytes than characters in UTF-8
+        self._size += len((self.format(record) + self.terminator).encode(self.encoding or "utf-8"))
+        if self._size < self.maxBytes:
+            return False
+
+        # 📌 Near the limit, let the base class decide and re-read the size afterwards
+        self._size = None
+        return bool(super().shouldRollover(record))
+
+
+# --- Background file writer ---
+_log_queue: queue.Queue = queue.Queue()
+_listener: QueueListener | None = None
+_init_lock = threading.Lock()
+
+# 📌 Records held in memory before a write, and the periodic flush interval
+_BUFFER_CAPACITY = 512
+_FLUSH_INTERVAL_S = 5
+
+# 📌 JSON sink is on by default; set PACKINGLINE_JSON_LOG=0 on stations where nobody reads app.json
+_JSON_LOG_ENABLED = os.environ.get("PACKINGLINE_JSON_LOG", "1") != "0"
+
+
+def _start_listener(log_file_txt: Path, log_file_json: Path) -> None:
+    """
+    Creates the shared TXT (and optional JSON) rotating handlers and starts the queue listener.
+
+    The listener writes records on its own thread, so logging calls only enqueue.
+    """
+    # pylint: disable=global-statement
+    global _listener
+
+    # 📌 TXT log with rotation
+    txt_handler = SizeTrackingRotatingFileHandler(log_file_txt, maxBytes=100_000_000, backupCount=5, encoding="utf-8", delay=True)
+    txt_formatter = CachedTimeFormatter("%(asctime)s | %(levelname)-7s | %(name)-23s | %(message)s")
+    txt_handler.setFormatter(txt_formatter)
+
+    handlers = [txt_handler]
+
+    # 📌 JSON log with rotation (can be switched off with PACKINGLINE_JSON_LOG=0)
+    if _JSON_LOG_ENABLED:
+        json_handler = SizeTrackingRotatingFileHandler(log_file_json, maxBytes=100_000_000, backupCount=5, encoding="utf-8", delay=True)
+        json_handler.setFormatter(JsonFormatter())
+        handlers.append(json_handler)
+
+    # 📌 Buffer records in memory, warnings and errors are written out immediately
+    buffered = [
+        MemoryHandler(_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=handler)
+        for handler in handlers
+    ]
+
+    _listener = QueueListener(_log_queue, *buffered, respect_handler_level=True)
+    _listener.start()
+
+    # ⏱️ Write buffered INFO/DEBUG records out periodically
+    threading.Thread(target=_flush_periodically, args=(buffered,), name="LogFlush", daemon=True).start()
+
+    # 🧹 On interpreter exit: drain the queue first (atexit is LIFO), then flush the buffers
+    for handler in buffered:
+        atexit.register(handler.flush)
+    atexit.register(_listener.stop)
+
+
+def _flush_periodically(handlers: list[MemoryHandler]) -> None:
+    """
+    Flushes the memory buffers every few seconds so INFO records reach disk promptly.
+    """
+    while True:
+        time.sleep(_FLUSH_INTERVAL_S)
+        for handler in handlers:
+            handler.flush()
 
 
 # --- Logger initialization ---
+@functools.cache
 def get_logger(name: str) -> logging.Logger:
     """
-    Initializes and returns a logger with both TXT and JSON rotating handlers.
+    Initializes and returns a logger feeding the shared TXT and JSON rotating handlers.
+
+    Results are cached per name, so repeated calls skip path resolution and handler checks.
 
     Args:
         name (str): Name of the logger (usually the module name).
@@ -52,27 +191,24 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance.
     """
-    log_file_txt = get_writable_path("logs/app.txt")
-    log_file_json = get_writable_path("logs/app.json")
-
-    # 🛡️ Ensure the existence of a folder
-    Path(log_file_txt).parent.mkdir(parents=True, exist_ok=True)
-
     logger = logging.getLogger(name)
     if logger.hasHandlers():
         return logger
 
     logger.setLevel(logging.DEBUG)
 
-    # 📌 TXT log with rotation
-    txt_handler = RotatingFileHandler(log_file_txt, maxBytes=100_000_000, backupCount=5, encoding="utf-8")
-    txt_formatter = logging.Formatter("%(asctime)s | %(levelname)-7s | %(name)-23s | %(message)s")
-    txt_handler.setFormatter(txt_formatter)
-    logger.addHandler(txt_handler)
+    # 📌 The first logger (from any thread) creates the log folder and starts the listener
+    with _init_lock:
+        if _listener is None:
+            log_file_txt = get_writable_path("logs/app.txt")
+            log_file_json = get_writable_path("logs/app.json")
+
+            # 🛡️ Ensure the existence of a folder (no-op when startup already created it)
+            ensure_logs_dir("logs")
+
+            _start_listener(log_file_txt, log_file_json)
 
-    # 📌 JSON log with rotation
-    json_handler = RotatingFileHandler(log_file_json, maxBytes=100_000_000, backupCount=5, encoding="utf-8")
-    json_handler.setFormatter(JsonFormatter())
-    logger.addHandler(json_handler)
+    # 📌 Records are enqueued here and written by the listener thread
+    logger.addHandler(QueueHandler(_log_queue))
 
     return logger
@@ -12,6 +12,7 @@ import configparser
 # 🧠 First-party (project-specific)
 from utils.bartender_utils import BartenderUtils
 from utils.messenger import Messenger
+from utils.resources import resolve_path
 
 from models.user_model import SzvDecrypt
 
@@ -33,5 +34,5 @@ class LoginServices:
             config (ConfigParser): Loaded configuration file.
             messenger (Messenger): Messenger instance for user feedback.
         """
-        self.decrypter = SzvDecrypt()
+        self.decrypter = SzvDecrypt(szv_input_file=resolve_path(config.get('Paths', 'szv_input_file')))
         self.bartender = BartenderUtils(messenger=messenger, config=config)
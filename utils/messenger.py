@@ -32,6 +32,7 @@ class Messenger:
         - Centering dialogs on parent or screen
     """
     icon_path = resource_path("views/assets/message.ico")
+    _icon: QIcon | None = None
 
     def __init__(self, parent=None):
         """
@@ -45,6 +46,25 @@ class Messenger:
         else:
             self.parent = None
 
+        self._screen_center = None
+
+        # 📌 Reusable auto-closing info dialog, built on first use
+        self._auto_dialog: QDialog | None = None
+        self._auto_label: QLabel | None = None
+        self._auto_timer: QTimer | None = None
+        self._auto_callback = None
+
+    @classmethod
+    def window_icon(cls) -> QIcon:
+        """
+        Returns the shared dialog icon, loaded from disk on first use only.
+
+        Created lazily because a QIcon needs an existing QApplication.
+        """
+        if cls._icon is None:
+            cls._icon = QIcon(str(cls.icon_path))
+        return cls._icon
+
     def center_dialog(self, dialog: QWidget):
         """
         Centers the dialog relative to the parent widget or screen.
@@ -52,36 +72,48 @@ class Messenger:
         Args:
             dialog (QWidget): The dialog to center.
         """
-        QApplication.instance().processEvents()
         dialog.adjustSize()
         rect = dialog.frameGeometry()
 
         if self.parent:
             parent_center = self.parent.geometry().center()
         else:
-            screen_center = QApplication.primaryScreen().availableGeometry().center()
-            parent_center = screen_center
+            # 📌 Screen geometry is looked up once per Messenger
+            if self._screen_center is None:
+                self._screen_center = QApplication.primaryScreen().availableGeometry().center()
+            parent_center = self._screen_center
 
         rect.moveCenter(parent_center)
         dialog.move(rect.topLeft())
 
-    def error(self, message: str, title: str = "Error"):
+    def _show(self, icon: QMessageBox.Icon, message: str, title: str):
         """
-        Displays a blocking error dialog.
+        Builds, centers and runs a blocking message box with the given icon.
 
         Args:
-            message (str): The error message to display.
+            icon (QMessageBox.Icon): Icon shown inside the dialog.
+            message (str): The message to display.
             title (str): Dialog window title.
         """
         box = QMessageBox(self.parent)
-        box.setIcon(QMessageBox.Icon.Critical)
+        box.setIcon(icon)
         box.setWindowTitle(title)
         box.setText(message)
-        box.setWindowIcon(QIcon(str(Messenger.icon_path)))
+        box.setWindowIcon(Messenger.window_icon())
         box.show()
         self.center_dialog(box)
         box.exec()
 
+    def error(self, message: str, title: str = "Error"):
+        """
+        Displays a blocking error dialog.
+
+        Args:
+            message (str): The error message to display.
+            title (str): Dialog window title.
+        """
+        self._show(QMessageBox.Icon.Critical, message, title)
+
     def info(self, message: str, title: str = "Information"):
         """
         Displays a blocking informational dialog.
@@ -90,14 +122,7 @@ class Messenger:
             message (str): The info message to display.
             title (str): Dialog window title.
         """
-        box = QMessageBox(self.parent)
-        box.setIcon(QMessageBox.Icon.Information)
-        box.setWindowTitle(title)
-        box.setText(message)
-        box.setWindowIcon(QIcon(str(Messenger.icon_path)))
-        box.show()
-        self.center_dialog(box)
-        box.exec()
+        self._show(QMessageBox.Icon.Information, message, title)
 
     def warning(self, message: str, title: str = "Warning"):
         """
@@ -107,26 +132,43 @@ class Messenger:
             message (str): The warning message to display.
             title (str): Dialog window title.
         """
-        box = QMessageBox(self.parent)
-        box.setIcon(QMessageBox.Icon.Warning)
-        box.setWindowTitle(title)
-        box.setText(message)
-        box.setWindowIcon(QIcon(str(Messenger.icon_path)))
-        box.show()
-        self.center_dialog(box)
-        box.exec()
+        self._show(QMessageBox.Icon.Warning, message, title)
 
-    def auto_info_dialog(self, message: str, timeout_ms: int = 3000, title: str = "Zpracování"):
+    def auto_info_dialog(self, message: str, timeout_ms: int = 3000, title: str = "Zpracování", finished_callback=None):
         """
         Displays a non-blocking info dialog that automatically closes after a timeout.
 
+        The dialog, its label and timer are created once per Messenger and reused by later calls.
+
         Args:
             message (str): The message to display.
             timeout_ms (int): Time in milliseconds before the dialog closes.
             title (str): Dialog window title.
+            finished_callback (callable, optional): Called right after the dialog closes on timeout.
+
+        Returns:
+            QDialog: The dialog; closing it early also cancels the timeout.
         """
-        dialog = QDialog(self.parent)
+        if self._auto_dialog is None:
+            self._build_auto_dialog()
+
+        dialog = self._auto_dialog
         dialog.setWindowTitle(title)
+        self._auto_label.setText(message)
+        self._auto_callback = finished_callback
+
+        dialog.adjustSize()
+        self.center_dialog(dialog)
+        dialog.show()
+
+        self._auto_timer.start(timeout_ms)
+        return dialog
+
+    def _build_auto_dialog(self):
+        """
+        Creates the reusable info dialog with its label and single-shot timer.
+        """
+        dialog = QDialog(self.parent)
         dialog.setObjectName("PrintInfoDialog")
         dialog.setWindowModality(Qt.WindowModality.NonModal)
 
@@ -138,20 +180,31 @@ class Messenger:
             Qt.WindowType.CustomizeWindowHint
         )
         # ✅ Header icon settings
-        dialog.setWindowIcon(QIcon(str(Messenger.icon_path)))
-
-        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.setWindowIcon(Messenger.window_icon())
 
         layout = QVBoxLayout()
-        label = QLabel(message)
+        label = QLabel()
         label.setObjectName("PrintInfoLabel")
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(label)
         dialog.setLayout(layout)
-
         dialog.setMinimumSize(300, 100)
-        dialog.adjustSize()
-        self.center_dialog(dialog)
-        dialog.show()
 
-        QTimer.singleShot(timeout_ms, dialog.close)
+        # ⏱️ Timer is owned by the dialog; closing the dialog early cancels the pending timeout
+        timer = QTimer(dialog)
+        timer.setSingleShot(True)
+        timer.timeout.connect(self._on_auto_timeout)
+        dialog.finished.connect(timer.stop)
+
+        self._auto_dialog = dialog
+        self._auto_label = label
+        self._auto_timer = timer
+
+    def _on_auto_timeout(self):
+        """
+        Hides the info dialog and runs the callback of the call that showed it.
+        """
+        self._auto_dialog.close()
+        callback, self._auto_callback = self._auto_callback, None
+        if callback:
+            callback()
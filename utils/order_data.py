@@ -7,8 +7,13 @@ related to work order files (.lbl, .nor).
 Author: Miloslav Hradecky
 """
 
+import os
+import locale
 from pathlib import Path
 
+# 📌 Encoding of .NOR/.lbl files (system ANSI code page), resolved once per process
+ORDER_FILE_ENCODING = locale.getpreferredencoding(False)
+
 
 class OrderData:
     """
@@ -22,6 +27,7 @@ class OrderData:
     """
     def __init__(self):
         self.orders_dir = Path("T:/Prikazy")
+        self._orders_prefix = str(self.orders_dir) + os.sep
         self.lbl_file = None
         self.nor_file = None
         self.lines = None
@@ -30,5 +36,6 @@ class OrderData:
         """
         Sets .lbl and .nor file paths based on the given order code.
         """
-        self.lbl_file = self.orders_dir / f"{order_code}.lbl"
-        self.nor_file = self.orders_dir / f"{order_code}.nor"
+        base = self._orders_prefix + order_code
+        self.lbl_file = Path(base + ".lbl")
+        self.nor_file = Path(base + ".nor")
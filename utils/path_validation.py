@@ -7,7 +7,7 @@ Responsibilities:
     - Load paths from the [Paths] section of config.ini
     - Check existence of each path or file
     - Log missing or invalid entries
-    - Notify user via Messenger dialogs
+    - Notify user via a single Messenger dialog
 
 Used during startup or diagnostics to ensure environment integrity.
 
@@ -15,12 +15,25 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
+import os
 import configparser
 
 # 🧠 First-party
 from utils.logger import get_logger
 from utils.messenger import Messenger
 from utils.resources import get_config_path
+from utils.config_cache import load_config
+
+# 📌 [Paths] keys that must point to an existing file or directory
+_KEYS: tuple[str, ...] = (
+    "reports_path",
+    "orders_path",
+    "trigger_path",
+    "szv_input_file",
+    "bartender_path",
+    "commander_path",
+    "guardian_path",
+)
 
 
 class PathValidator:
@@ -28,7 +41,7 @@ class PathValidator:
     🧭 Validates critical paths defined in the configuration file.
 
     Checks whether required files and directories exist, logs issues,
-    and displays warnings to the user via Messenger.
+    and reports all problems to the user in one Messenger dialog.
     """
 
     def __init__(self):
@@ -38,21 +51,10 @@ class PathValidator:
 
         # 📌 Loading the configuration file
         config_path = get_config_path("config.ini")
-        self.config = configparser.ConfigParser()
-        self.config.optionxform = str  # 💡 Ensures letter size is maintained
-        self.config.read(config_path)
+        self.config = load_config(config_path)
 
         self.logger = get_logger("PathValidator")
         self.messenger = Messenger()
-        self.keys = [
-            "reports_path",
-            "orders_path",
-            "trigger_path",
-            "szv_input_file",
-            "bartender_path",
-            "commander_path",
-            "guardian_path"
-        ]
         self.missing = []
 
     def validate(self) -> bool:
@@ -62,23 +64,30 @@ class PathValidator:
         Returns:
             bool: True if all paths are valid, False otherwise.
         """
-        for key in self.keys:
+        _exists = os.path.exists  # 📌 Plain stat via os.path, no Path.exists() indirection per key
+
+        # 📌 Problems are only logged here and reported to the user in one dialog below
+        for key in _KEYS:
+            # 📌 Read key by key, so one malformed value (e.g. a lone %) only fails its own entry
             try:
                 raw = self.config.get("Paths", key)
-                path = get_config_path(raw)
-                if not path.exists():
-                    self.logger.warning("Cesta nebo soubor neexistuje: %s → %s", key, path)
-                    self.messenger.warning(f"Cesta nebo soubor neexistuje:\n{path}", "Path Validation")
-                    self.missing.append((key, path))
-            except Exception as e:
-                self.logger.error("Chyba při čtení %s: %s", key, str(e))
-                self.messenger.error(f"Chyba při čtení '{key}': {e}", "Path Validation")
-                self.missing.append((key, "chyba v configu"))
+            except (configparser.NoSectionError, configparser.NoOptionError):
+                self.logger.error("Chyba při čtení %s: klíč chybí v sekci [Paths]", key)
+                self.missing.append((key, "chyba v configu: klíč chybí"))
+                continue
+            except configparser.Error as e:
+                self.logger.error("Chyba při čtení %s: %s", key, e)
+                self.missing.append((key, f"chyba v configu: {e}"))
+                continue
+
+            path = get_config_path(raw)
+            if not _exists(path):
+                self.logger.warning("Cesta nebo soubor neexistuje: %s → %s", key, path)
+                self.missing.append((key, path))
 
         if self.missing:
-            self.messenger.error("Následující cesty jsou neplatné nebo chybí soubor:", "Path Validation")
-            for key, path in self.missing:
-                self.messenger.error(f"\n{key}\n{path}", "Path Validation")
+            details = "\n".join(f"\n{key}\n{path}" for key, path in self.missing)
+            self.messenger.error(f"Následující cesty jsou neplatné nebo chybí soubor:\n{details}", "Path Validation")
             return False
 
         self.logger.info("Všechny cesty v configu jsou validní.")
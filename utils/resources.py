@@ -13,22 +13,32 @@ Author: Miloslav Hradecky
 """
 
 # 🧱 Standard library
+import os
 import sys
+import functools
 from pathlib import Path
 
+# 📌 Base directories resolved once at import: PyInstaller bundle (if frozen), this module's folder and the executable's folder
+_BUNDLE_DIR: Path | None = Path(sys._MEIPASS) if hasattr(sys, "_MEIPASS") else None  # type: ignore
+_MODULE_DIR = Path(__file__).resolve().parent
+_EXE_DIR = Path(sys.argv[0]).resolve().parent
 
+
+@functools.cache
 def resource_path(relative_path: str) -> Path:
     """
     Resolves absolute path to a resource file.
     Supports both standard execution and PyInstaller-packed (.exe) environments.
+
+    Cached per relative path, the filesystem probe runs only on the first lookup.
     """
-    try:
-        base_path = Path(sys._MEIPASS)  # type: ignore
-    except AttributeError:
-        base_path = Path(__file__).resolve().parent
-        if not (base_path / relative_path).exists():
-            base_path = Path.cwd()
-    return base_path / relative_path
+    if _BUNDLE_DIR is not None:
+        return _BUNDLE_DIR / relative_path
+
+    candidate = _MODULE_DIR / relative_path
+    if candidate.exists():
+        return candidate
+    return Path.cwd() / relative_path
 
 
 def resolve_path(config_value: str) -> Path:
@@ -36,23 +46,24 @@ def resolve_path(config_value: str) -> Path:
     Resolves config-defined path to an absolute path.
     Handles both absolute and relative inputs.
     """
-    path = Path(config_value)
-    if path.is_absolute():
-        return path
+    if os.path.isabs(config_value):
+        return Path(config_value)
     return resource_path(config_value)
 
 
+@functools.cache
 def get_writable_path(relative_path: str) -> Path:
     """
     Returns writable path relative to the script or executable location.
     Used for logs, outputs, or temp files.
     """
-    return Path(sys.argv[0]).resolve().parent / relative_path
+    return _EXE_DIR / relative_path
 
 
+@functools.cache
 def get_config_path(filename: str = "config.ini") -> Path:
     """
     Returns absolute path to the configuration file.
     Defaults to 'config.ini' in the current executable directory.
     """
-    return Path(sys.argv[0]).resolve().parent / filename
+    return _EXE_DIR / filename
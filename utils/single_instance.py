@@ -5,12 +5,16 @@ Utility for preventing multiple instances of the application.
 
 Responsibilities:
     - Use QSharedMemory to detect if another instance is already running
-    - Block duplicate launches by checking shared memory attachment
+    - Block duplicate launches by atomically creating the shared memory segment
     - Used during application startup to enforce single-instance behavior
 
 Author: Miloslav Hradecky
 """
 
+# 🧱 Standard library
+import atexit
+import functools
+
 # 🧩 Third-party libraries
 from PyQt6.QtCore import QSharedMemory
 
@@ -19,8 +23,9 @@ class SingleInstanceChecker:
     """
     Prevents multiple instances of the application using QSharedMemory.
 
-    Checks whether a shared memory block with a unique key is already attached.
-    If so, assumes another instance is running.
+    Tries to create a shared memory block with a unique key.
+    If it already exists, assumes another instance is running.
+    The checker must stay referenced for the process lifetime, otherwise the segment is released.
     """
 
     def __init__(self, key="LinebUniqueAppKey"):
@@ -32,6 +37,8 @@ class SingleInstanceChecker:
         """
         self.key = key
         self.shared_memory = QSharedMemory(self.key)
+        self._running = None
+        atexit.register(self.shared_memory.detach)  # 💡 Release the segment explicitly on exit
 
     def is_running(self):
         """
@@ -39,9 +46,30 @@ class SingleInstanceChecker:
 
         Returns:
             bool: True if another instance is detected, False otherwise.
+            The result is cached, repeated calls do not touch the shared memory again.
         """
-        if self.shared_memory.attach():
-            return True
-        if not self.shared_memory.create(1):
-            return True
-        return False
+        if self._running is None:
+            # 📌 create() fails atomically when the segment already exists, no separate attach() probe needed
+            self._running = not self.shared_memory.create(1)
+        return self._running
+
+
+def get_checker(key="LinebUniqueAppKey"):
+    """
+    Returns the process-wide SingleInstanceChecker for the key, creating it on first use.
+
+    Args:
+        key (str): Unique identifier for the shared memory segment.
+
+    Returns:
+        SingleInstanceChecker: Shared checker instance.
+    """
+    return _checker_for(key)
+
+
+@functools.cache
+def _checker_for(key):
+    """
+    Creates one checker per key; positional-only so default and explicit keys share an entry.
+    """
+    return SingleInstanceChecker(key)
@@ -14,25 +14,25 @@ Author: Miloslav Hradecky
 # 🧱 Standard library
 import socket
 import platform
+import functools
 
 # 🧠 First-party
 from utils.logger import get_logger
 
 
-def log_system_info(version: str):
+@functools.cache
+def _get_host_info() -> tuple[str, str]:
     """
-    Logs system information including application version, computer name, and IP address.
-
-    Args:
-        version (str): Current version of the application.
+    Returns (computer_name, ip_address), looked up once per process.
     """
-    logger = get_logger("SystemInfo")
-
-    # 📌 IP address
-    try:
-        ip_address = socket.gethostbyname(socket.gethostname())
-    except socket.gaierror:
-        ip_address = "Neznámá"
+    # 📌 IP address: UDP connect only selects the outgoing interface, no packet or DNS lookup is involved
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(0.1)
+        try:
+            sock.connect(("10.255.255.255", 1))
+            ip_address = sock.getsockname()[0]
+        except OSError:
+            ip_address = "Neznámá"
 
     # 📌 PC Name
     try:
@@ -40,4 +40,17 @@ def log_system_info(version: str):
     except OSError:
         computer_name = "Neznámý"
 
+    return computer_name, ip_address
+
+
+def log_system_info(version: str):
+    """
+    Logs system information including application version, computer name, and IP address.
+
+    Args:
+        version (str): Current version of the application.
+    """
+    logger = get_logger("SystemInfo")
+    computer_name, ip_address = _get_host_info()
+
     logger.info("Aplikace v%s spuštěna | PC: %s | IP: %s", version, computer_name, ip_address)
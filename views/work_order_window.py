@@ -109,3 +109,21 @@ class WorkOrderWindow(QWidget):
         self.raise_()
         self.work_order_input.setFocus()
         self.effects.fade_in(self, duration=500)
+
+    def disable_inputs(self):
+        """
+        Disables all interactive input controls.
+        """
+        self.next_button.setDisabled(True)
+        self.back_button.setDisabled(True)
+        self.exit_button.setDisabled(True)
+        self.work_order_input.setDisabled(True)
+
+    def restore_inputs(self):
+        """
+        Enables all interactive input controls.
+        """
+        self.next_button.setDisabled(False)
+        self.back_button.setDisabled(False)
+        self.exit_button.setDisabled(False)
+        self.work_order_input.setDisabled(False)